@@ -0,0 +1,89 @@
+# Замер разбора страницы листинга (1000 элементов) разными способами:
+# прежний путь (apparent_encoding + resp.json()), json.loads по байтам,
+# orjson и потоковый ijson (--decode incremental). Пиковая память — tracemalloc.
+#
+#   python benchmarks/bench_decode.py --items 1000 --repeat 20
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+from mock_fsa_server import MockConfig, MockRegistry
+
+class RawBody(io.BytesIO):
+    decode_content = False
+
+class StreamedResponse:
+
+    # Минимум от requests.Response, который нужен decode_listing_stream.
+    def __init__(self, body):
+        self.raw = RawBody(body)
+
+    def close(self):
+        pass
+
+def listing_page(items):
+    # per_day с запасом: у дня случайный вес 0.6–1.4 от среднего.
+    registry = MockRegistry(MockConfig(per_day=items * 2))
+    page, total = registry.listing(date(2025, 1, 15).isoformat(), date(2025, 1, 15).isoformat(), 0, items)
+    return json.dumps({"items": page, "total": total}, ensure_ascii=False).encode("utf-8")
+
+def legacy_decode(body):
+    resp = requests.models.Response()
+    resp._content = body
+    resp.status_code = 200
+    resp.headers["Content-Type"] = "application/json; charset=utf-8"
+    resp.encoding = resp.apparent_encoding if resp.apparent_encoding else 'utf-8'
+    return resp.json()
+
+def variants():
+    yield "apparent_encoding + resp.json() (было)", legacy_decode
+    yield "json.loads(bytes)", json.loads
+    try:
+        import orjson
+        yield "orjson.loads(bytes)", orjson.loads
+    except ImportError:
+        print("orjson не установлен — пропускаем")
+    try:
+        import ijson  # noqa: F401
+        yield "ijson, потоково", lambda body: main.decode_listing_stream(StreamedResponse(body))
+    except ImportError:
+        print("ijson не установлен — пропускаем")
+
+def measure(fn, body, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        data = fn(body)
+    seconds = (time.perf_counter() - started) / repeat
+    tracemalloc.start()
+    fn(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak, data
+
+def run(args):
+    body = listing_page(args.items)
+    print(f"Страница: {len(json.loads(body)['items'])} элементов, {len(body) / 2**20:.2f} МБ")
+    print(f"{'способ':<40}{'мс/стр.':>10}{'ускорение':>11}{'пик МБ':>9}")
+    baseline = None
+    expected = None
+    for label, fn in variants():
+        seconds, peak, data = measure(fn, body, args.repeat)
+        baseline = baseline or seconds
+        expected = expected or data
+        mark = "" if data == expected else "  ОШИБКА: результат отличается"
+        print(f"{label:<40}{seconds * 1000:>10.1f}{baseline / seconds:>10.1f}x{peak / 2**20:>9.1f}{mark}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Замер разбора JSON страницы листинга")
+    parser.add_argument("--items", type=int, default=main.PAGE_SIZE, help="элементов на странице")
+    parser.add_argument("--repeat", type=int, default=20, help="повторов на каждый способ")
+    run(parser.parse_args())
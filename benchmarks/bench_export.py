@@ -0,0 +1,85 @@
+# Замер времени выгрузки: очистка строк, построение ссылок и запись в каждый
+# формат, в пересчёте на 100 тыс. строк. Для сравнения рядом считается
+# прежняя поячеечная очистка (re.sub через col.map) и ссылка через .apply.
+#
+#   python benchmarks/bench_export.py --rows 100000
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+def synthetic_declarations(rows, seed=0):
+    rnd = random.Random(seed)
+    items = []
+    for i in range(rows):
+        items.append({
+            "id": 10_000_000 + i,
+            "applicantName": f'ООО "Ромашка-{rnd.randint(1, 50000)}"' + ("\x0b" if i % 97 == 0 else ""),
+            "applicantInn": str(rnd.randint(10**9, 10**10 - 1)),
+            "manufacterName": f"Завод №{rnd.randint(1, 5000)}\x01" if i % 53 == 0 else f"Завод №{rnd.randint(1, 5000)}",
+            "manufacterInn": str(rnd.randint(10**9, 10**10 - 1)),
+            "declDate": f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}T00:00:00",
+            "applicantPhone": f"+7 ({rnd.randint(900, 999)}) {rnd.randint(100, 999)}-{rnd.randint(1000, 9999)}",
+            "applicantEmail": f"info{i}@example.ru",
+        })
+    return items
+
+def legacy_clean_illegal_chars(df):
+    def clean_text(x):
+        if isinstance(x, str):
+            return re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F]', '', x)
+        return x
+    return df.apply(lambda col: col.map(clean_text) if col.dtype == object or pd.api.types.is_string_dtype(col) else col)
+
+def legacy_links(ids):
+    return ids.apply(lambda x: f"https://pub.fsa.gov.ru/rds/declaration/view/{x}/common" if pd.notnull(x) else "")
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+def main_bench(rows, formats):
+    per_100k = 100_000 / rows
+    df = pd.DataFrame(synthetic_declarations(rows)).rename(columns=main.field_mapping)
+    results = []
+
+    elapsed, _ = timed(legacy_clean_illegal_chars, df.copy())
+    results.append(("очистка: re.sub по ячейкам (было)", elapsed))
+    elapsed, _ = timed(main.clean_illegal_chars, df.copy())
+    results.append(("очистка: .str.replace (стало)", elapsed))
+    elapsed, _ = timed(legacy_links, df["ID"])
+    results.append(("ссылки: .apply (было)", elapsed))
+    elapsed, _ = timed(main.document_links, df["ID"])
+    results.append(("ссылки: конкатенация .str (стало)", elapsed))
+
+    declarations = synthetic_declarations(rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in formats:
+            path = os.path.join(tmp, f"out.{fmt}")
+            # Ошибки записи (например, нет pyarrow для parquet) export_declarations
+            # перехватывает сам и сообщает через возвращаемое значение.
+            elapsed, saved = timed(main.export_declarations, [dict(item) for item in declarations], path)
+            if not saved:
+                print(f"{fmt}: пропущено, файл не создан")
+                continue
+            results.append((f"export_declarations -> {fmt} ({os.path.getsize(path) // 1024} КБ)", elapsed))
+
+    print(f"\nСтрок: {rows}; время в пересчёте на 100 тыс. строк")
+    for name, elapsed in results:
+        print(f"  {name:<45} {elapsed * per_100k:8.3f} с")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарк выгрузки деклараций")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--formats", nargs="+", default=list(main.EXPORT_FORMATS))
+    args = parser.parse_args()
+    main_bench(args.rows, args.formats)
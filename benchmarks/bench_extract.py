@@ -0,0 +1,94 @@
+# Микробенчмарк извлечения контактов из HTML страницы заявителя на сохранённых
+# страницах из benchmarks/fixtures. Для сравнения рядом считается прежний
+# разбор всей страницы через BeautifulSoup(..., "html.parser").
+#
+# Ограничение: страницы в fixtures синтетические — их выдаёт
+# mock_fsa_server.py (applicant_html), а не реестр. В них есть только теги,
+# на которые опирается разбор (fgis-rds-view-contacts, fgis-card-info-row,
+# info-row__header/info-row__text), и однотипный наполнитель до ~150 КБ.
+# Настоящая страница после отрисовки Angular содержит скрипты, стили и
+# атрибуты компонентов, поэтому абсолютные времена на ней будут другими;
+# сравнивать стоит только варианты между собой. Если появится
+# обезличенная реальная страница, её нужно добавить сюда с ожидаемым результатом.
+#
+#   python benchmarks/bench_extract.py --repeat 50
+import argparse
+import os
+import re
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import contacts_extract
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Ожидаемый результат (телефон, почта) для каждой страницы.
+EXPECTED = {
+    "applicant_contacts.html": ("+7 (957) 100-0057", "info010057@example.ru"),
+    "applicant_no_container.html": ("+7 (957) 100-0057", "info010057@example.ru"),
+    "applicant_empty_contacts.html": (None, None),
+}
+
+def legacy_extract(html):
+    soup = BeautifulSoup(html, "html.parser")
+    phone = None
+    email = None
+    container = soup.find("fgis-rds-view-contacts")
+    if container:
+        for ec in container.find_all("fgis-card-edit-row-two-columns"):
+            for row in ec.find_all("fgis-card-info-row"):
+                header_div = row.find("div", class_="info-row__header")
+                text_div = row.find("div", class_="info-row__text")
+                if header_div and text_div:
+                    header_text = header_div.get_text(strip=True)
+                    if "Номер телефона" in header_text and not phone:
+                        p = text_div.find("p")
+                        if p:
+                            phone = p.get_text(strip=True)
+                    elif "Адрес электронной почты" in header_text and not email:
+                        p = text_div.find("p")
+                        if p:
+                            email = p.get_text(strip=True)
+    if not phone:
+        phones_found = re.compile(r'\+7\s*\(?\d{3}\)?[\s-]?\d{3}[\s-]?\d{4}').findall(html)
+        if phones_found:
+            phone = phones_found[0]
+    if not email:
+        emails_found = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+').findall(html)
+        if emails_found:
+            email = emails_found[0]
+    return phone, email
+
+def timed(fn, html, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(html)
+    return (time.perf_counter() - started) / repeat, result
+
+def main(args):
+    variants = [("bs4, вся страница (было)", legacy_extract)]
+    for parser in contacts_extract.PARSERS:
+        variants.append((f"{parser}, фрагмент", lambda html, parser=parser: contacts_extract.extract_contacts(html, parser)[:2]))
+
+    print(f"{'страница':<32}{'КБ':>6}  {'вариант':<28}{'мкс/стр.':>12}{'ускорение':>11}")
+    failed = False
+    for name in sorted(EXPECTED):
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+            html = f.read()
+        baseline = None
+        for label, fn in variants:
+            seconds, result = timed(fn, html, args.repeat)
+            baseline = baseline or seconds
+            mark = "" if result == EXPECTED[name] else f"  ОШИБКА: {result}"
+            failed = failed or bool(mark)
+            print(f"{name:<32}{len(html) // 1024:>6}  {label:<28}{seconds * 1e6:>12.0f}{baseline / seconds:>10.1f}x{mark}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Замер извлечения контактов из HTML страницы заявителя")
+    parser.add_argument("--repeat", type=int, default=20, help="повторов на каждую страницу")
+    main(parser.parse_args())
@@ -0,0 +1,48 @@
+# Замер времени импорта main.py и тяжёлых зависимостей, которые теперь
+# загружаются лениво. Каждый замер — отдельный процесс, из результата
+# вычитается запуск пустого интерпретатора; берётся медиана.
+#
+#   python benchmarks/bench_import.py --repeat 7
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "selenium.webdriver.support.ui", "bs4", "lxml.html", "tqdm", "jwt")
+
+def timed_run(code, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, check=True)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+def run(args):
+    startup = timed_run("pass", args.repeat)
+    print(f"Запуск пустого интерпретатора: {startup * 1000:.0f} мс (вычитается ниже)")
+    print(f"{'импорт':<40}{'мс':>8}")
+    main_cost = timed_run("import main", args.repeat) - startup
+    print(f"{'import main':<40}{main_cost * 1000:>8.0f}")
+    check = ("import sys, main; loaded = [m for m in %r if m in sys.modules]; "
+             "print('  загружено при импорте main:', ', '.join(loaded) or 'ничего из тяжёлых')" % (HEAVY_MODULES,))
+    subprocess.run([sys.executable, "-c", check], cwd=ROOT_DIR, check=True)
+    deferred = 0.0
+    for module in HEAVY_MODULES:
+        try:
+            cost = timed_run(f"import {module}", args.repeat) - startup
+        except subprocess.CalledProcessError:
+            print(f"{module:<40}{'нет':>8}")
+            continue
+        deferred += cost
+        print(f"{'  отложено: ' + module:<40}{cost * 1000:>8.0f}")
+    print(f"Без ленивых импортов main загружался бы примерно за {(main_cost + deferred) * 1000:.0f} мс")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Замер времени импорта main.py")
+    parser.add_argument("--repeat", type=int, default=5, help="запусков на каждый замер")
+    run(parser.parse_args())
@@ -0,0 +1,184 @@
+# Сквозной замер пропускной способности листинга и обогащения на локальном
+# стенде (benchmarks/mock_fsa_server.py): запросов/с, деклараций/с, p50/p99
+# задержки ответа и пиковая память по этапам. Без --url стенд запускается
+# отдельным процессом, чтобы его генерация ответов не делила GIL с парсером.
+#
+#   python benchmarks/bench_pipeline.py --start 01-01-2025 --end 31-01-2025 --latency-ms 40
+#   python benchmarks/bench_pipeline.py --json bench.json   # для сравнения между коммитами
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.request
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+from mock_fsa_server import MockConfig
+
+STATUSES = list(range(1, 11))
+DECL_TYPES = [1, 2, 3, 4, 5]
+APPLICANT_TYPES = [1, 2, 3, 4, 5]
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def spawn_server(args):
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    proc = subprocess.Popen([
+        sys.executable, os.path.join(BENCH_DIR, "mock_fsa_server.py"), "--port", str(port),
+        "--per-day", str(args.per_day), "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--page-latency-ms", str(args.page_latency_ms), "--error-rate", str(args.error_rate),
+    ], stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"{url}/__stats", timeout=1).read()
+            return proc, url
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("Стенд FSA не запустился")
+
+def run_stage(name, fn, latencies, trace_memory):
+
+    latencies.clear()
+    if trace_memory:
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    processed = fn()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    requests_done = len(latencies)
+    return {
+        "stage": name,
+        "seconds": round(elapsed, 3),
+        "requests": requests_done,
+        "requests_per_sec": round(requests_done / elapsed, 1) if elapsed else 0.0,
+        "declarations": processed,
+        "declarations_per_sec": round(processed / elapsed, 1) if elapsed else 0.0,
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "latency_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "peak_memory_mb": round(peak / 2**20, 1) if peak is not None else None,
+    }
+
+def bench(args):
+
+    server_proc = None
+    if args.url:
+        base_url = args.url
+    else:
+        server_proc, base_url = spawn_server(args)
+    # FSA_BASE_URL читается при импорте main, поэтому импортируем после запуска стенда.
+    os.environ["FSA_BASE_URL"] = base_url
+    import main
+
+    latencies = []
+    lock = threading.Lock()
+
+    def record_latency(resp, *args, **kwargs):
+        with lock:
+            latencies.append(resp.elapsed.total_seconds())
+
+    session = main.build_session("bench-token", {}, None)
+    session.hooks["response"].append(record_latency)
+
+    if args.memory:
+        tracemalloc.start()
+    results = []
+    listed = []
+    for engine in args.engines:
+        for planner in args.planners:
+
+            def listing():
+                declarations, _ = main.get_all_declarations(
+                    "bench-token", args.start, args.end, STATUSES, DECL_TYPES, APPLICANT_TYPES, {}, None,
+                    max_workers=args.workers, engine=engine, planner=planner, session=session
+                )
+                listed[:] = declarations
+                return len(declarations)
+
+            results.append(run_stage(f"listing/{engine}/{planner}", listing, latencies, args.memory))
+
+    def enrichment():
+        items = [dict(item) for item in listed[:args.enrich_limit]]
+        enriched = main.enrich_with_contacts(items, session, None, max_workers=args.enrich_workers,
+                                             backend=args.backend)
+        return len(enriched)
+
+    if args.enrich_limit:
+        results.append(run_stage(f"enrichment/{args.backend}", enrichment, latencies, args.memory))
+
+    def list_all(on_items=None):
+        declarations, _ = main.get_all_declarations(
+            "bench-token", args.start, args.end, STATUSES, DECL_TYPES, APPLICANT_TYPES, {}, None,
+            max_workers=args.workers, engine=args.engines[0], planner=args.planners[0], session=session,
+            on_items=on_items
+        )
+        return declarations
+
+    def sequential():
+        enriched = main.enrich_with_contacts(list_all(), session, None, max_workers=args.enrich_workers,
+                                             backend=args.backend)
+        return len(enriched)
+
+    def pipelined():
+
+        def produce(put):
+            list_all(lambda items: [put(item) for item in items])
+
+        enriched = main.enrich_with_contacts(main.iter_pipelined(produce, args.queue_size), session, None,
+                                             max_workers=args.enrich_workers, backend=args.backend)
+        return len(enriched)
+
+    if args.pipeline:
+        results.append(run_stage(f"sequential/{args.backend}", sequential, latencies, args.memory))
+        results.append(run_stage(f"pipeline/{args.backend}", pipelined, latencies, args.memory))
+
+    print(f"\nСтенд: {base_url}; период {args.start} — {args.end}")
+    header = f"{'этап':<28}{'сек':>8}{'запр.':>8}{'запр/с':>9}{'декл.':>9}{'декл/с':>9}{'p50 мс':>9}{'p99 мс':>9}{'пик МБ':>9}"
+    print(header)
+    for r in results:
+        peak = "-" if r["peak_memory_mb"] is None else r["peak_memory_mb"]
+        print(f"{r['stage']:<28}{r['seconds']:>8}{r['requests']:>8}{r['requests_per_sec']:>9}{r['declarations']:>9}"
+              f"{r['declarations_per_sec']:>9}{r['latency_p50_ms']:>9}{r['latency_p99_ms']:>9}{peak:>9}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if server_proc is not None:
+        server_proc.terminate()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарк листинга и обогащения на локальном стенде FSA")
+    parser.add_argument("--url", help="адрес уже запущенного стенда; без него стенд поднимается в процессе")
+    parser.add_argument("--start", default="01-01-2025")
+    parser.add_argument("--end", default="14-01-2025")
+    parser.add_argument("--per-day", type=int, default=MockConfig.per_day)
+    parser.add_argument("--latency-ms", type=float, default=MockConfig.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=MockConfig.jitter_ms)
+    parser.add_argument("--page-latency-ms", type=float, default=MockConfig.page_latency_ms)
+    parser.add_argument("--error-rate", type=float, default=MockConfig.error_rate)
+    parser.add_argument("--engines", nargs="+", default=["threads", "asyncio"])
+    parser.add_argument("--planners", nargs="+", default=["daily", "adaptive"])
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--backend", default="http", help="способ получения контактов (http/selenium/auto)")
+    parser.add_argument("--enrich-workers", type=int, default=10)
+    parser.add_argument("--enrich-limit", type=int, default=1000, help="сколько деклараций обогащать; 0 — пропустить")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="сравнить полный прогон листинг→обогащение: последовательно и конвейером")
+    parser.add_argument("--queue-size", type=int, default=1000, help="размер очереди конвейера")
+    parser.add_argument("--memory", action="store_true", help="считать пиковую память через tracemalloc (медленнее)")
+    parser.add_argument("--json", help="сохранить результаты в JSON")
+    bench(parser.parse_args())
@@ -0,0 +1,250 @@
+# Локальный стенд реестра FSA для замеров без обращения к pub.fsa.gov.ru.
+# Отдаёт синтетические данные в формате боевого API:
+#   POST /api/v1/rds/common/declarations/get   — постраничный листинг с фильтром regDate
+#   GET  /api/v1/rds/common/declarations/<id>  — JSON-карточка с контактами заявителя
+#   GET  /rds/declaration/view/<id>/applicant  — HTML страницы заявителя (для Selenium)
+#   GET  /__stats                              — счётчики запросов стенда
+# Объёмы, задержка и доля ошибок настраиваются; данные детерминированы (--seed).
+#
+#   python benchmarks/mock_fsa_server.py --port 8085 --per-day 300 --latency-ms 40 --error-rate 0.01
+#   FSA_BASE_URL=http://127.0.0.1:8085 python main.py ...
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+@dataclass
+class MockConfig:
+    per_day: int = 300
+    latency_ms: float = 30.0
+    jitter_ms: float = 10.0
+    page_latency_ms: float = 300.0
+    error_rate: float = 0.0
+    inn_pool: int = 20000
+    html_padding_kb: int = 150
+    seed: int = 0
+
+class MockRegistry:
+
+    def __init__(self, config):
+        self.config = config
+        self._day_counts = {}
+        self._lock = threading.Lock()
+        self.stats = {"listing": 0, "card": 0, "applicant_page": 0, "errors": 0}
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def day_count(self, day):
+        with self._lock:
+            count = self._day_counts.get(day)
+            if count is None:
+                rnd = random.Random(day.toordinal() * 7919 + self.config.seed)
+                weight = 0.15 if day.weekday() >= 5 else rnd.uniform(0.6, 1.4)
+                if rnd.random() < 0.05:
+                    weight *= 10
+                count = int(self.config.per_day * weight)
+                self._day_counts[day] = count
+        return count
+
+    def _hash(self, doc_id, salt=0):
+        # Дешёвый детерминированный хэш вместо random.Random на каждую запись.
+        return ((doc_id + self.config.seed * 1000003 + salt) * 2654435761) & 0xFFFFFFFF
+
+    def applicant_inn(self, doc_id):
+        return str(7700000000 + self._hash(doc_id) % self.config.inn_pool)
+
+    def declaration(self, day, index):
+        doc_id = (day.toordinal() - 730000) * 100000 + index
+        h = self._hash(doc_id, 1)
+        inn = self.applicant_inn(doc_id)
+        return {
+            "id": doc_id,
+            "idDecl": doc_id,
+            "number": f"ЕАЭС N RU Д-RU.РА01.В.{doc_id % 100000:05d}/{day.year % 100}",
+            "declDate": day.isoformat(),
+            "endDate": (day + timedelta(days=1825)).isoformat(),
+            "idStatus": h % 10 + 1,
+            "applicantName": f'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ЗАЯВИТЕЛЬ-{inn[-5:]}"',
+            "applicantInn": inn,
+            "manufacterName": f'АКЦИОНЕРНОЕ ОБЩЕСТВО "ЗАВОД-{h % 5000 + 1}"',
+            "manufacterInn": str(5000000000 + h % 10**6),
+            "productFullName": "Изделия " + " ".join(f"модель-{(h >> k) % 999 + 1}" for k in range(12)),
+            "productOrig": "Российская Федерация",
+            "technicalReglaments": [{"id": h % 60 + 1, "name": f"ТР ТС 0{h % 40 + 1:02d}/2011"}],
+            "group": {"idGroupRU": [h % 500 + 1], "idGroupEEU": []},
+            "applicantType": {"id": h % 5 + 1},
+        }
+
+    def contacts(self, doc_id):
+        inn = self.applicant_inn(doc_id)
+        digits = int(inn[-7:])
+        phone = f"+7 (9{digits % 100:02d}) {digits // 100 % 1000:03d}-{digits % 10000:04d}"
+        email = f"info{inn[-6:]}@example.ru"
+        return phone, email
+
+    def listing(self, min_date, max_date, page, size):
+        start = date.fromisoformat(min_date)
+        end = date.fromisoformat(max_date)
+        # Сортировка declDate DESC: сначала последние дни окна.
+        days = []
+        current = end
+        while current >= start:
+            days.append((current, self.day_count(current)))
+            current -= timedelta(days=1)
+        total = sum(count for _, count in days)
+        offset = page * size
+        items = []
+        for day, count in days:
+            if offset >= count:
+                offset -= count
+                continue
+            for index in range(offset, count):
+                items.append(self.declaration(day, index))
+                if len(items) == size:
+                    return items, total
+            offset = 0
+        return items, total
+
+    def applicant_html(self, doc_id):
+        phone, email = self.contacts(doc_id)
+        padding = "".join(
+            f'<fgis-card-info-row><div class="info-row__header">Поле {i}</div>'
+            f'<div class="info-row__text"><p>Значение {i} для {doc_id}</p></div></fgis-card-info-row>'
+            for i in range(self.config.html_padding_kb * 1024 // 160)
+        )
+        return (
+            "<!DOCTYPE html><html><head><title>Заявитель</title></head><body><fgis-root>"
+            f"<fgis-rds-view-applicant><section>{padding}</section>"
+            "<fgis-rds-view-contacts><h3>Контактные данные</h3>"
+            "<fgis-card-edit-row-two-columns>"
+            '<fgis-card-info-row><div class="info-row__header">Номер телефона</div>'
+            f'<div class="info-row__text"><p>{phone}</p></div></fgis-card-info-row>'
+            '<fgis-card-info-row><div class="info-row__header">Адрес электронной почты</div>'
+            f'<div class="info-row__text"><p>{email}</p></div></fgis-card-info-row>'
+            "</fgis-card-edit-row-two-columns></fgis-rds-view-contacts>"
+            "</fgis-rds-view-applicant></fgis-root></body></html>"
+        )
+
+CARD_PATH = re.compile(r"^/api/v1/rds/common/declarations/(\d+)$")
+APPLICANT_PATH = re.compile(r"^/rds/declaration/view/(\d+)/applicant$")
+
+def make_handler(registry):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _delay(self, base_ms):
+            config = registry.config
+            delay = max(0.0, base_ms + random.uniform(-config.jitter_ms, config.jitter_ms))
+            time.sleep(delay / 1000)
+
+        def _maybe_fail(self):
+            if registry.config.error_rate and random.random() < registry.config.error_rate:
+                registry.count("errors")
+                self._send(random.choice((429, 503)), b'{"error": "mock failure"}', "application/json")
+                return True
+            return False
+
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, data):
+            self._send(200, json.dumps(data, ensure_ascii=False).encode("utf-8"), "application/json")
+
+        def do_POST(self):
+            if self.path != "/api/v1/rds/common/declarations/get":
+                self._send(404, b"{}", "application/json")
+                return
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            registry.count("listing")
+            self._delay(registry.config.latency_ms)
+            if self._maybe_fail():
+                return
+            reg_date = payload["filter"]["regDate"]
+            items, total = registry.listing(reg_date["minDate"], reg_date["maxDate"], payload["page"], payload["size"])
+            self._send_json({"items": items, "total": total})
+
+        def do_GET(self):
+            if self.path == "/__stats":
+                self._send_json(registry.stats)
+                return
+            match = CARD_PATH.match(self.path)
+            if match:
+                registry.count("card")
+                self._delay(registry.config.latency_ms)
+                if self._maybe_fail():
+                    return
+                doc_id = int(match.group(1))
+                phone, email = registry.contacts(doc_id)
+                self._send_json({
+                    "idDeclaration": doc_id,
+                    "applicant": {"contacts": [
+                        {"id": doc_id * 10 + 1, "idContactType": 1, "value": phone},
+                        {"id": doc_id * 10 + 4, "idContactType": 4, "value": email},
+                    ]},
+                })
+                return
+            match = APPLICANT_PATH.match(self.path)
+            if match:
+                registry.count("applicant_page")
+                self._delay(registry.config.page_latency_ms)
+                if self._maybe_fail():
+                    return
+                self._send(200, registry.applicant_html(int(match.group(1))).encode("utf-8"), "text/html")
+                return
+            self._send(404, b"not found", "text/plain")
+
+    return Handler
+
+def start_server(config=None, host="127.0.0.1", port=0):
+
+    # Запускает стенд в фоновом потоке; port=0 — любой свободный порт.
+    registry = MockRegistry(config or MockConfig())
+    server = ThreadingHTTPServer((host, port), make_handler(registry))
+    server.daemon_threads = True
+    server.registry = registry
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Локальный стенд реестра деклараций FSA")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--per-day", type=int, default=MockConfig.per_day, help="среднее число деклараций в будний день")
+    parser.add_argument("--latency-ms", type=float, default=MockConfig.latency_ms, help="задержка ответа API")
+    parser.add_argument("--jitter-ms", type=float, default=MockConfig.jitter_ms, help="разброс задержки")
+    parser.add_argument("--page-latency-ms", type=float, default=MockConfig.page_latency_ms,
+                        help="задержка HTML страницы заявителя")
+    parser.add_argument("--error-rate", type=float, default=MockConfig.error_rate, help="доля ответов 429/503")
+    parser.add_argument("--inn-pool", type=int, default=MockConfig.inn_pool, help="число различных ИНН заявителей")
+    parser.add_argument("--html-padding-kb", type=int, default=MockConfig.html_padding_kb,
+                        help="примерный размер HTML страницы заявителя, КБ")
+    parser.add_argument("--seed", type=int, default=MockConfig.seed)
+    args = parser.parse_args()
+    config = MockConfig(
+        per_day=args.per_day, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        page_latency_ms=args.page_latency_ms, error_rate=args.error_rate, inn_pool=args.inn_pool,
+        html_padding_kb=args.html_padding_kb, seed=args.seed,
+    )
+    server, url = start_server(config, args.host, args.port)
+    print(f"Стенд FSA запущен: {url} (Ctrl+C для остановки)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,22 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+def test_iter_declaration_ids_reads_links_and_numbers():
+    lines = [
+        "https://pub.fsa.gov.ru/rds/declaration/view/20250101001/common\n",
+        "  20250101002 \n",
+        "не id\n",
+        "20250101002\n",
+    ]
+    assert list(main.iter_declaration_ids(lines)) == [20250101001, 20250101002]
+
+def test_iter_declaration_ids_skips_bom(tmp_path):
+    path = tmp_path / "ids.txt"
+    path.write_bytes("42\n43\n".encode("utf-8-sig"))
+    with open(path, encoding="utf-8-sig") as f:
+        assert list(main.iter_declaration_ids(f)) == [42, 43]
+    # BOM, дошедший до строки (например, через stdin), тоже не теряет id.
+    assert list(main.iter_declaration_ids(["\ufeff42\n"])) == [42]
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+FORMATS = ["xlsx", "csv", "jsonl", "parquet"]
+
+def declaration(doc_id, inn, phone=""):
+    return {
+        "id": doc_id,
+        "applicantName": f'ООО "Заявитель {doc_id}"',
+        "applicantInn": inn,
+        "manufacterName": "Завод",
+        "manufacterInn": "0105012345",
+        "declDate": "2025-01-02T00:00:00",
+        "applicantPhone": phone,
+        "applicantEmail": "",
+    }
+
+def require_format(ext):
+    if ext == "parquet":
+        pytest.importorskip("pyarrow")
+
+@pytest.mark.parametrize("ext", FORMATS)
+def test_merge_into_dataset_keeps_leading_zeros(tmp_path, ext):
+    require_format(ext)
+    path = str(tmp_path / f"dataset.{ext}")
+    main.merge_into_dataset(path, [declaration(1, "0274062111", "89001234567"), declaration(2, "7701000001")])
+    # Второе слияние перечитывает набор и перезаписывает его.
+    main.merge_into_dataset(path, [declaration(2, "7701000002"), declaration(3, "0300000003")])
+
+    df = main.read_dataset(path)
+    rows = {int(row["ID"]): row for _, row in df.iterrows()}
+    assert sorted(rows) == [1, 2, 3]
+    assert rows[1]["ИНН Заявителя"] == "0274062111"
+    assert rows[1]["ИНН Производителя"] == "0105012345"
+    assert rows[1]["Телефон Заявителя"] == "89001234567"
+    assert rows[2]["ИНН Заявителя"] == "7701000002"
+    assert rows[3]["ИНН Заявителя"] == "0300000003"
+    assert main.dataset_ids(path) == {1, 2, 3}
+
+@pytest.mark.parametrize("ext", FORMATS)
+def test_merge_shards_keeps_leading_zeros(tmp_path, ext):
+    require_format(ext)
+    output = str(tmp_path / f"result.{ext}")
+    shards = [main.shard_path(output, index, 2) for index in range(2)]
+    assert main.export_declarations([declaration(1, "0274062111"), declaration(2, "7701000001")], shards[0])
+    assert main.export_declarations([declaration(2, "7701000002"), declaration(3, "0900000003")], shards[1])
+
+    assert main.merge_shards(shards, output) == 3
+    df = main.read_dataset(output)
+    inns = {int(row["ID"]): row["ИНН Заявителя"] for _, row in df.iterrows()}
+    assert inns == {1: "0274062111", 2: "7701000002", 3: "0900000003"}
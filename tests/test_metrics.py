@@ -0,0 +1,24 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+def test_mixed_status_labels():
+    # Код ответа (int) и имя исключения (str) в одной метке не ломают сортировку.
+    m = main.Metrics()
+    m.inc("fsa_requests_total", stage="listing", status=200)
+    m.inc("fsa_requests_total", stage="listing", status="ReadTimeout")
+    m.inc("fsa_requests_total", stage="listing", status=200)
+    m.observe("fsa_request_seconds", 0.1, stage="listing", status=503)
+    m.observe("fsa_request_seconds", 0.2, stage="listing", status="ConnectionError")
+
+    summary = m.summary()
+    assert 'fsa_requests_total{stage="listing",status="ReadTimeout"}: 1' in summary
+    text = m.render_prometheus()
+    assert 'fsa_requests_total{stage="listing",status="200"} 2' in text
+    assert 'fsa_requests_total{stage="listing",status="ReadTimeout"} 1' in text
+    snapshot = json.loads(json.dumps(m.snapshot()))
+    statuses = {c["labels"]["status"]: c["value"] for c in snapshot["counters"]}
+    assert statuses == {"200": 2, "ReadTimeout": 1}